@@ -8,23 +8,220 @@ Configure your answers in the compliance_config dictionary below.
 """
 
 import argparse
+import functools
 import json
 import sys
-from typing import Dict, List, Set
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List
 from dataclasses import dataclass, field
+from enum import IntFlag
 
+if TYPE_CHECKING:
+    import numpy
 
-@dataclass
+
+class Law(IntFlag):
+    """Bit flags for the federal laws the assessment can identify"""
+
+    HIPAA = 1
+    FDCA = 2
+    INFO_BLOCKING = 4
+    FTC_ACT = 8
+    HBNR = 16
+    COPPA = 32
+    OARFPA = 64
+
+
+# Display names for the report, keyed by flag.
+_LAW_NAMES = {
+    Law.HIPAA: "HIPAA Rules",
+    Law.FDCA: "Federal Food, Drug, and Cosmetic Act (FD&C Act)",
+    Law.INFO_BLOCKING: "21st Century Cures Act - Information Blocking Regulations",
+    Law.FTC_ACT: "Federal Trade Commission Act (FTC Act)",
+    Law.HBNR: "FTC Health Breach Notification Rule",
+    Law.COPPA: "Children's Online Privacy Protection Act (COPPA)",
+    Law.OARFPA: "Opioid Addiction Recovery Fraud Prevention Act (OARFPA)",
+}
+
+
+@dataclass(slots=True)
 class ComplianceResult:
-    """Results of the compliance assessment"""
+    """Results of the compliance assessment
+
+    slots=True drops the per-instance __dict__, which matters when batch
+    runs create one result per config.
 
-    applicable_laws: Set[str] = field(default_factory=set)
+    applicable_laws is a bitmask of Law flags rather than a set of names:
+    membership tests and inserts are single integer ops, and the universe
+    of laws is fixed and small.
+    """
+
+    applicable_laws: Law = Law(0)
     recommendations: List[str] = field(default_factory=list)
     required_actions: List[str] = field(default_factory=list)
     resources: Dict[str, str] = field(default_factory=dict)
     warnings: List[str] = field(default_factory=list)
 
 
+# The answers to the survey questions, in a fixed order: each key's position
+# is its bit in the memoization key built by evaluate().
+_CONFIG_KEYS = (
+    "collects_health_info",
+    "has_identifiable_health_info",
+    "is_health_plan",
+    "is_healthcare_provider",
+    "offers_certified_hit",
+    "enables_ehi_exchange",
+    "requires_prescription",
+    "works_for_covered_entity",
+    "intended_for_medical_use",
+    "is_administrative_or_lifestyle_only",
+    "is_low_risk",
+    "has_fda_regulated_function",
+    "is_consumer_facing",
+    "interacts_with_phr",
+    "intended_for_children",
+    "has_child_oriented_features",
+    "children_using_app",
+    "offers_substance_use_treatment",
+)
+
+
+# Static report text. The checks extend/update from these constants instead
+# of building the same strings on every evaluation.
+_NO_HEALTH_INFO_RECOMMENDATION = (
+    "Your app may not be subject to health-specific regulations if it doesn't "
+    "collect health information, but general consumer protection laws may still apply."
+)
+
+_HIPAA_COVERED_ACTION = (
+    "As a HIPAA covered entity, you must comply with HIPAA Privacy, Security, "
+    "and Breach Notification Rules for all Protected Health Information (PHI)."
+)
+_HIPAA_BA_ACTION = (
+    "As a HIPAA business associate, you must sign a Business Associate Agreement (BAA) "
+    "and comply with HIPAA Privacy, Security, and Breach Notification Rules."
+)
+_HIPAA_NOT_COVERED_RECOMMENDATION = (
+    "HIPAA does not apply to your app, but other federal laws (like the FTC Act) "
+    "still require you to protect consumer health information with reasonable "
+    "privacy and security practices."
+)
+_HIPAA_RESOURCES = {
+    "HIPAA": "https://www.hhs.gov/hipaa/index.html",
+    "HIPAA for Mobile Apps": (
+        "https://www.hhs.gov/hipaa/for-professionals/special-topics/health-apps/index.html"
+    ),
+}
+
+_FDA_EXEMPT_RECOMMENDATION = (
+    "Your app may be exempt from FDA device regulation under Section 520(o) "
+    "of the 21st Century Cures Act if it's solely for administrative support "
+    "or healthy lifestyle maintenance."
+)
+_FDA_LOW_RISK_RECOMMENDATION = (
+    "Your app may be considered low-risk by the FDA. FDA does not intend to "
+    "enforce device requirements for low-risk apps that help patients self-manage "
+    "or automate simple tasks."
+)
+_FDA_REGULATED_ACTION = (
+    "Your app contains a device software function that is the focus of FDA's "
+    "regulatory oversight. You must comply with FDA medical device regulations."
+)
+_FDA_REGULATED_WARNING = (
+    "FDA REGULATED DEVICE: Your app may require pre-market review, registration, "
+    "and ongoing compliance. Contact FDA immediately."
+)
+_FDA_PRESCRIPTION_ACTION = (
+    "Apps requiring a prescription are likely subject to FDA regulation as "
+    "medical devices."
+)
+_FDA_RESOURCES = {
+    "FDA Digital Health": (
+        "https://www.fda.gov/medical-devices/digital-health-center-excellence"
+    ),
+    "FDA Policy Navigator": (
+        "https://www.fda.gov/medical-devices/digital-health-center-excellence/"
+        "digital-health-policy-navigator"
+    ),
+}
+
+_INFO_BLOCKING_CERTIFIED_HIT_ACTION = (
+    "If you certify health IT through the ASTP/ONC Health IT Certification Program, "
+    "your technology must meet specific privacy and security requirements and you "
+    "must make certain public attestations."
+)
+_INFO_BLOCKING_RESOURCES = {
+    "Information Blocking": "https://www.healthit.gov/topic/information-blocking",
+}
+
+_FTC_ACT_ACTIONS = (
+    "Section 5 of the FTC Act applies to most app developers. You must:",
+    "  • Have reasonable privacy and security practices",
+    "  • Honor your privacy policy and any promises made to users",
+    "  • Not engage in unfair or deceptive practices regarding data collection, use, or security",
+)
+_FTC_ACT_CERTIFIED_HIT_ACTION = (
+    "  • Live up to any transparency attestations made through the ONC Health IT Certification Program"
+)
+_FTC_ACT_RESOURCES = {
+    "FTC Privacy & Security": "https://www.ftc.gov/business-guidance/privacy-security",
+}
+
+_HBNR_ACTION = (
+    "You must provide breach notifications to consumers, the FTC, and in some cases "
+    "the media, following any unauthorized access to or acquisition of unsecured "
+    "identifiable health information."
+)
+_HBNR_WARNING = (
+    "BREACH NOTIFICATION REQUIRED: Failure to provide required breach notifications "
+    "can result in significant civil penalties from the FTC."
+)
+_HBNR_RESOURCES = {
+    "Health Breach Notification Rule": (
+        "https://www.ftc.gov/legal-library/browse/rules/health-breach-notification-rule"
+    ),
+}
+
+_COPPA_ACTIONS = (
+    "COPPA requires you to:",
+    "  • Provide clear notice to parents about what information you collect from children under 13",
+    "  • Obtain verifiable parental consent before collecting children's personal information",
+    "  • Establish reasonable procedures to protect children's information",
+)
+_COPPA_WARNING = (
+    "CHILDREN'S DATA: Apps collecting data from children under 13 have strict requirements. "
+    "Consult with legal counsel familiar with COPPA."
+)
+_COPPA_RESOURCES = {
+    "COPPA": "https://www.ftc.gov/business-guidance/privacy-security/childrens-privacy",
+}
+
+_OARFPA_ACTION = (
+    "The FTC can seek civil penalties for unfair or deceptive acts or practices "
+    "related to substance use disorder treatment services or products."
+)
+_OARFPA_WARNING = (
+    "SUBSTANCE USE TREATMENT: Enhanced scrutiny applies. Ensure all claims about "
+    "treatment efficacy are truthful and not misleading."
+)
+
+_GENERAL_RECOMMENDATIONS = (
+    "Implement reasonable data security measures including encryption, access controls, "
+    "and regular security assessments.",
+    "Create a clear, prominent privacy policy that explains what data you collect, "
+    "how you use it, who you share it with, and how users can access or delete their data.",
+    "Obtain meaningful consent from users before collecting or sharing their health information.",
+    "Minimize data collection to only what's necessary for your app's functionality.",
+    "Implement data retention and deletion policies.",
+)
+_GENERAL_RESOURCES = {
+    "FTC Best Practices for Mobile Health Apps": (
+        "https://www.ftc.gov/tips-advice/business-center/guidance/mobile-health-app-developers-ftc-best-practices"
+    ),
+}
+
+
 # CONFIGURE YOUR APP DETAILS HERE
 # compliance_config = {
 #     # Question 1: Does/will your app collect, share, use, or maintain health information?
@@ -89,364 +286,411 @@ class HealthAppComplianceChecker:
         self.result = ComplianceResult()
 
     def evaluate(self) -> ComplianceResult:
-        """Run all compliance checks and return results"""
-
-        # Check if health information is collected
-        if not self.config["collects_health_info"]:
-            self.result.recommendations.append(
-                "Your app may not be subject to health-specific regulations if it doesn't "
-                "collect health information, but general consumer protection laws may still apply."
-            )
-            return self.result
+        """Run all compliance checks and return results
+
+        Results for each distinct set of answers are memoized, so repeated
+        evaluations (e.g. batch runs over many config files) collapse into
+        a single cache lookup.
+        """
+        key = 0
+        for i, k in enumerate(_CONFIG_KEYS):
+            if self.config[k]:
+                key |= 1 << i
+
+        cached = self._evaluate_cached(key)
+        self.result = ComplianceResult(
+            applicable_laws=cached.applicable_laws,
+            recommendations=list(cached.recommendations),
+            required_actions=list(cached.required_actions),
+            resources=dict(cached.resources),
+            warnings=list(cached.warnings),
+        )
+        return self.result
 
-        # Check HIPAA applicability
-        self._check_hipaa()
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _evaluate_cached(key: int) -> ComplianceResult:
+        """Run the checks for one packed config and cache the result.
+
+        The assessment is deterministic for a given set of answers, so the
+        result for each bitmask is computed at most once. The cached result
+        holds immutable containers so it can safely be shared between calls;
+        evaluate() hands callers fresh mutable copies.
+        """
+        config = {k: bool((key >> i) & 1) for i, k in enumerate(_CONFIG_KEYS)}
+        # pylint still treats this as client access even inside the class,
+        # because the call goes through a fresh instance rather than self.
+        result = HealthAppComplianceChecker(config)._run_checks()  # pylint: disable=protected-access
+        return ComplianceResult(
+            applicable_laws=result.applicable_laws,
+            recommendations=tuple(result.recommendations),
+            required_actions=tuple(result.required_actions),
+            resources=result.resources,
+            warnings=tuple(result.warnings),
+        )
 
-        # Check FDA applicability
-        self._check_fda()
+    def _run_checks(self) -> ComplianceResult:
+        """Evaluate every compliance check against self.config"""
+        cfg = self.config
 
-        # Check Information Blocking regulations
-        self._check_information_blocking()
+        # Check if health information is collected; this gates every other
+        # check, so nothing else is evaluated when it's false.
+        if not cfg["collects_health_info"]:
+            self.result.recommendations.append(_NO_HEALTH_INFO_RECOMMENDATION)
+            return self.result
+
+        # Compute the shared predicates once so the individual checks don't
+        # each re-read the same config booleans.
+        is_covered_entity = cfg["is_health_plan"] or cfg["is_healthcare_provider"]
+        is_business_associate = cfg["works_for_covered_entity"]
+        is_child_related = (
+            cfg["intended_for_children"]
+            or cfg["has_child_oriented_features"]
+            or cfg["children_using_app"]
+        )
+        is_fda_candidate = cfg["intended_for_medical_use"]
+
+        # Checks run cheapest-first: the FTC Act always applies, then checks
+        # gated by a single precomputed boolean, with FDA (deepest branching)
+        # last. Each check bails out immediately when its guard is false.
 
         # Check FTC Act (applies to most apps)
         self._check_ftc_act()
 
-        # Check FTC Health Breach Notification Rule
-        self._check_health_breach_notification()
+        # Check OARFPA
+        self._check_oarfpa()
 
         # Check COPPA
-        self._check_coppa()
+        self._check_coppa(is_child_related)
 
-        # Check OARFPA
-        self._check_oarfpa()
+        # Check HIPAA applicability
+        self._check_hipaa(is_covered_entity, is_business_associate)
+
+        # Check FTC Health Breach Notification Rule
+        self._check_health_breach_notification(
+            is_covered_entity or is_business_associate
+        )
+
+        # Check Information Blocking regulations
+        self._check_information_blocking()
+
+        # Check FDA applicability
+        self._check_fda(is_fda_candidate)
 
         # Add general recommendations
         self._add_general_recommendations()
 
         return self.result
 
-    def _check_hipaa(self):
+    def _check_hipaa(self, is_covered_entity, is_business_associate):
         """Check if HIPAA Rules apply"""
-        is_covered_entity = (
-            self.config["is_health_plan"] or self.config["is_healthcare_provider"]
-        )
-
-        is_business_associate = self.config["works_for_covered_entity"]
-
         if is_covered_entity or is_business_associate:
-            self.result.applicable_laws.add("HIPAA Rules")
+            self.result.applicable_laws |= Law.HIPAA
 
             if is_covered_entity:
-                self.result.required_actions.append(
-                    "As a HIPAA covered entity, you must comply with HIPAA Privacy, Security, "
-                    "and Breach Notification Rules for all Protected Health Information (PHI)."
-                )
+                self.result.required_actions.append(_HIPAA_COVERED_ACTION)
             else:
-                self.result.required_actions.append(
-                    "As a HIPAA business associate, you must sign a Business Associate Agreement (BAA) "
-                    "and comply with HIPAA Privacy, Security, and Breach Notification Rules."
-                )
+                self.result.required_actions.append(_HIPAA_BA_ACTION)
 
-            self.result.resources["HIPAA"] = "https://www.hhs.gov/hipaa/index.html"
-            self.result.resources["HIPAA for Mobile Apps"] = (
-                "https://www.hhs.gov/hipaa/for-professionals/special-topics/health-apps/index.html"
-            )
+            self.result.resources.update(_HIPAA_RESOURCES)
         else:
             if self.config["has_identifiable_health_info"]:
                 self.result.recommendations.append(
-                    "HIPAA does not apply to your app, but other federal laws (like the FTC Act) "
-                    "still require you to protect consumer health information with reasonable "
-                    "privacy and security practices."
+                    _HIPAA_NOT_COVERED_RECOMMENDATION
                 )
 
-    def _check_fda(self):
+    def _check_fda(self, is_fda_candidate):
         """Check if FDA regulations apply"""
-        if self.config["intended_for_medical_use"]:
-            # Check for exemptions
-            if self.config["is_administrative_or_lifestyle_only"]:
-                self.result.recommendations.append(
-                    "Your app may be exempt from FDA device regulation under Section 520(o) "
-                    "of the 21st Century Cures Act if it's solely for administrative support "
-                    "or healthy lifestyle maintenance."
-                )
-                return
-
-            if (
-                self.config["is_low_risk"]
-                and not self.config["has_fda_regulated_function"]
-            ):
-                self.result.recommendations.append(
-                    "Your app may be considered low-risk by the FDA. FDA does not intend to "
-                    "enforce device requirements for low-risk apps that help patients self-manage "
-                    "or automate simple tasks."
-                )
-            elif self.config["has_fda_regulated_function"]:
-                self.result.applicable_laws.add(
-                    "Federal Food, Drug, and Cosmetic Act (FD&C Act)"
-                )
-                self.result.required_actions.append(
-                    "Your app contains a device software function that is the focus of FDA's "
-                    "regulatory oversight. You must comply with FDA medical device regulations."
-                )
-                self.result.warnings.append(
-                    "FDA REGULATED DEVICE: Your app may require pre-market review, registration, "
-                    "and ongoing compliance. Contact FDA immediately."
-                )
-                self.result.resources["FDA Digital Health"] = (
-                    "https://www.fda.gov/medical-devices/digital-health-center-excellence"
-                )
-                self.result.resources["FDA Policy Navigator"] = (
-                    "https://www.fda.gov/medical-devices/digital-health-center-excellence/"
-                    "digital-health-policy-navigator"
-                )
-            elif self.config["requires_prescription"]:
-                self.result.applicable_laws.add(
-                    "Federal Food, Drug, and Cosmetic Act (FD&C Act)"
-                )
-                self.result.required_actions.append(
-                    "Apps requiring a prescription are likely subject to FDA regulation as "
-                    "medical devices."
-                )
+        if not is_fda_candidate:
+            return
+
+        cfg = self.config
+
+        # Check for exemptions
+        if cfg["is_administrative_or_lifestyle_only"]:
+            self.result.recommendations.append(_FDA_EXEMPT_RECOMMENDATION)
+            return
+
+        fda_regulated = cfg["has_fda_regulated_function"]
+        if cfg["is_low_risk"] and not fda_regulated:
+            self.result.recommendations.append(_FDA_LOW_RISK_RECOMMENDATION)
+        elif fda_regulated:
+            self.result.applicable_laws |= Law.FDCA
+            self.result.required_actions.append(_FDA_REGULATED_ACTION)
+            self.result.warnings.append(_FDA_REGULATED_WARNING)
+            self.result.resources.update(_FDA_RESOURCES)
+        elif cfg["requires_prescription"]:
+            self.result.applicable_laws |= Law.FDCA
+            self.result.required_actions.append(_FDA_PRESCRIPTION_ACTION)
 
     def _check_information_blocking(self):
         """Check if Information Blocking regulations apply"""
-        if (
-            self.config["is_healthcare_provider"]
-            or self.config["offers_certified_hit"]
-            or self.config["enables_ehi_exchange"]
-        ):
+        cfg = self.config
+        is_provider = cfg["is_healthcare_provider"]
+        certified_hit = cfg["offers_certified_hit"]
+        ehi_exchange = cfg["enables_ehi_exchange"]
 
-            self.result.applicable_laws.add(
-                "21st Century Cures Act - Information Blocking Regulations"
-            )
-
-            actor_type = []
-            if self.config["is_healthcare_provider"]:
-                actor_type.append("health care provider")
-            if self.config["offers_certified_hit"]:
-                actor_type.append("health IT developer of certified health IT")
-            if self.config["enables_ehi_exchange"]:
-                actor_type.append("health information network/exchange")
-
-            self.result.required_actions.append(
-                f"As a {', '.join(actor_type)}, you must comply with Information Blocking "
-                "regulations. You cannot engage in practices that interfere with access, "
-                "exchange, or use of Electronic Health Information (EHI) unless covered by "
-                "a regulatory exception."
-            )
-
-            if self.config["offers_certified_hit"]:
-                self.result.required_actions.append(
-                    "If you certify health IT through the ASTP/ONC Health IT Certification Program, "
-                    "your technology must meet specific privacy and security requirements and you "
-                    "must make certain public attestations."
-                )
+        if not (is_provider or certified_hit or ehi_exchange):
+            return
 
-            self.result.resources["Information Blocking"] = (
-                "https://www.healthit.gov/topic/information-blocking"
-            )
+        self.result.applicable_laws |= Law.INFO_BLOCKING
 
-    def _check_ftc_act(self):
-        """Check FTC Act applicability"""
-        self.result.applicable_laws.add("Federal Trade Commission Act (FTC Act)")
+        actor_type = []
+        if is_provider:
+            actor_type.append("health care provider")
+        if certified_hit:
+            actor_type.append("health IT developer of certified health IT")
+        if ehi_exchange:
+            actor_type.append("health information network/exchange")
 
         self.result.required_actions.append(
-            "Section 5 of the FTC Act applies to most app developers. You must:"
-        )
-        self.result.required_actions.append(
-            "  • Have reasonable privacy and security practices"
-        )
-        self.result.required_actions.append(
-            "  • Honor your privacy policy and any promises made to users"
-        )
-        self.result.required_actions.append(
-            "  • Not engage in unfair or deceptive practices regarding data collection, use, or security"
+            f"As a {', '.join(actor_type)}, you must comply with Information Blocking "
+            "regulations. You cannot engage in practices that interfere with access, "
+            "exchange, or use of Electronic Health Information (EHI) unless covered by "
+            "a regulatory exception."
         )
 
+        if certified_hit:
+            self.result.required_actions.append(_INFO_BLOCKING_CERTIFIED_HIT_ACTION)
+
+        self.result.resources.update(_INFO_BLOCKING_RESOURCES)
+
+    def _check_ftc_act(self):
+        """Check FTC Act applicability"""
+        self.result.applicable_laws |= Law.FTC_ACT
+
+        self.result.required_actions.extend(_FTC_ACT_ACTIONS)
+
         if self.config["offers_certified_hit"]:
-            self.result.required_actions.append(
-                "  • Live up to any transparency attestations made through the ONC Health IT Certification Program"
-            )
+            self.result.required_actions.append(_FTC_ACT_CERTIFIED_HIT_ACTION)
 
-        self.result.resources["FTC Privacy & Security"] = (
-            "https://www.ftc.gov/business-guidance/privacy-security"
-        )
+        self.result.resources.update(_FTC_ACT_RESOURCES)
 
-    def _check_health_breach_notification(self):
+    def _check_health_breach_notification(self, hipaa_applies):
         """Check FTC Health Breach Notification Rule"""
+        cfg = self.config
         if (
-            self.config["is_consumer_facing"]
-            and self.config["interacts_with_phr"]
-            and not (
-                self.config["is_health_plan"]
-                or self.config["is_healthcare_provider"]
-                or self.config["works_for_covered_entity"]
-            )
+            cfg["is_consumer_facing"]
+            and cfg["interacts_with_phr"]
+            and not hipaa_applies
         ):
 
-            self.result.applicable_laws.add("FTC Health Breach Notification Rule")
+            self.result.applicable_laws |= Law.HBNR
 
-            self.result.required_actions.append(
-                "You must provide breach notifications to consumers, the FTC, and in some cases "
-                "the media, following any unauthorized access to or acquisition of unsecured "
-                "identifiable health information."
-            )
+            self.result.required_actions.append(_HBNR_ACTION)
 
-            self.result.warnings.append(
-                "BREACH NOTIFICATION REQUIRED: Failure to provide required breach notifications "
-                "can result in significant civil penalties from the FTC."
-            )
+            self.result.warnings.append(_HBNR_WARNING)
 
-            self.result.resources["Health Breach Notification Rule"] = (
-                "https://www.ftc.gov/legal-library/browse/rules/health-breach-notification-rule"
-            )
+            self.result.resources.update(_HBNR_RESOURCES)
 
-    def _check_coppa(self):
+    def _check_coppa(self, is_child_related):
         """Check COPPA applicability"""
-        if (
-            self.config["intended_for_children"]
-            or self.config["has_child_oriented_features"]
-            or self.config["children_using_app"]
-        ):
+        if not is_child_related:
+            return
 
-            self.result.applicable_laws.add(
-                "Children's Online Privacy Protection Act (COPPA)"
-            )
-
-            self.result.required_actions.append("COPPA requires you to:")
-            self.result.required_actions.append(
-                "  • Provide clear notice to parents about what information you collect from children under 13"
-            )
-            self.result.required_actions.append(
-                "  • Obtain verifiable parental consent before collecting children's personal information"
-            )
-            self.result.required_actions.append(
-                "  • Establish reasonable procedures to protect children's information"
-            )
-
-            self.result.warnings.append(
-                "CHILDREN'S DATA: Apps collecting data from children under 13 have strict requirements. "
-                "Consult with legal counsel familiar with COPPA."
-            )
-
-            self.result.resources["COPPA"] = (
-                "https://www.ftc.gov/business-guidance/privacy-security/childrens-privacy"
-            )
+        self.result.applicable_laws |= Law.COPPA
+
+        self.result.required_actions.extend(_COPPA_ACTIONS)
+
+        self.result.warnings.append(_COPPA_WARNING)
+
+        self.result.resources.update(_COPPA_RESOURCES)
 
     def _check_oarfpa(self):
         """Check OARFPA applicability"""
         if self.config["offers_substance_use_treatment"]:
-            self.result.applicable_laws.add(
-                "Opioid Addiction Recovery Fraud Prevention Act (OARFPA)"
-            )
+            self.result.applicable_laws |= Law.OARFPA
 
-            self.result.required_actions.append(
-                "The FTC can seek civil penalties for unfair or deceptive acts or practices "
-                "related to substance use disorder treatment services or products."
-            )
+            self.result.required_actions.append(_OARFPA_ACTION)
 
-            self.result.warnings.append(
-                "SUBSTANCE USE TREATMENT: Enhanced scrutiny applies. Ensure all claims about "
-                "treatment efficacy are truthful and not misleading."
-            )
+            self.result.warnings.append(_OARFPA_WARNING)
 
     def _add_general_recommendations(self):
         """Add general best practices recommendations"""
-        self.result.recommendations.append(
-            "Implement reasonable data security measures including encryption, access controls, "
-            "and regular security assessments."
-        )
-        self.result.recommendations.append(
-            "Create a clear, prominent privacy policy that explains what data you collect, "
-            "how you use it, who you share it with, and how users can access or delete their data."
-        )
-        self.result.recommendations.append(
-            "Obtain meaningful consent from users before collecting or sharing their health information."
-        )
-        self.result.recommendations.append(
-            "Minimize data collection to only what's necessary for your app's functionality."
-        )
-        self.result.recommendations.append(
-            "Implement data retention and deletion policies."
-        )
+        self.result.recommendations.extend(_GENERAL_RECOMMENDATIONS)
 
-        self.result.resources["FTC Best Practices for Mobile Health Apps"] = (
-            "https://www.ftc.gov/tips-advice/business-center/guidance/mobile-health-app-developers-ftc-best-practices"
-        )
+        self.result.resources.update(_GENERAL_RESOURCES)
 
     def print_report(self):
         """Print a formatted compliance report"""
         result = self.evaluate()
 
-        print("\n" + "=" * 80)
-        print("MOBILE HEALTH APP COMPLIANCE ASSESSMENT REPORT")
-        print("=" * 80 + "\n")
+        # Assemble the whole report first and write it in one go, rather
+        # than issuing one write per line.
+        out: List[str] = []
+
+        out.append("\n" + "=" * 80)
+        out.append("MOBILE HEALTH APP COMPLIANCE ASSESSMENT REPORT")
+        out.append("=" * 80 + "\n")
 
         # Warnings
         if result.warnings:
-            print("⚠️  CRITICAL WARNINGS:")
-            print("-" * 80)
+            out.append("⚠️  CRITICAL WARNINGS:")
+            out.append("-" * 80)
             for warning in result.warnings:
-                print(f"  ⚠️  {warning}\n")
+                out.append(f"  ⚠️  {warning}\n")
 
         # Applicable Laws
-        print("📋 APPLICABLE FEDERAL LAWS & REGULATIONS:")
-        print("-" * 80)
+        out.append("📋 APPLICABLE FEDERAL LAWS & REGULATIONS:")
+        out.append("-" * 80)
         if result.applicable_laws:
-            for law in sorted(result.applicable_laws):
-                print(f"  ✓ {law}")
+            for name in sorted(
+                _LAW_NAMES[law] for law in Law if law & result.applicable_laws
+            ):
+                out.append(f"  ✓ {name}")
         else:
-            print("  No specific health regulations identified, but general consumer")
-            print("  protection laws may still apply.")
-        print()
+            out.append("  No specific health regulations identified, but general consumer")
+            out.append("  protection laws may still apply.")
+        out.append("")
 
         # Required Actions
         if result.required_actions:
-            print("✅ REQUIRED COMPLIANCE ACTIONS:")
-            print("-" * 80)
+            out.append("✅ REQUIRED COMPLIANCE ACTIONS:")
+            out.append("-" * 80)
             for action in result.required_actions:
                 if action.startswith("  •"):
-                    print(action)
+                    out.append(action)
                 else:
-                    print(f"  • {action}")
-            print()
+                    out.append(f"  • {action}")
+            out.append("")
 
         # Recommendations
         if result.recommendations:
-            print("💡 RECOMMENDATIONS & BEST PRACTICES:")
-            print("-" * 80)
+            out.append("💡 RECOMMENDATIONS & BEST PRACTICES:")
+            out.append("-" * 80)
             for rec in result.recommendations:
-                print(f"  • {rec}")
-            print()
+                out.append(f"  • {rec}")
+            out.append("")
 
         # Resources
-        print("📚 HELPFUL RESOURCES:")
-        print("-" * 80)
+        out.append("📚 HELPFUL RESOURCES:")
+        out.append("-" * 80)
         for name, url in result.resources.items():
-            print(f"  • {name}")
-            print(f"    {url}")
-        print()
+            out.append(f"  • {name}")
+            out.append(f"    {url}")
+        out.append("")
+
+        out.append("=" * 80)
+        out.append("DISCLAIMER: This tool provides informational guidance only and does not")
+        out.append("constitute legal advice. Consult with qualified legal counsel to ensure")
+        out.append("full compliance with all applicable laws and regulations.")
+        out.append("=" * 80 + "\n")
 
-        print("=" * 80)
-        print("DISCLAIMER: This tool provides informational guidance only and does not")
-        print("constitute legal advice. Consult with qualified legal counsel to ensure")
-        print("full compliance with all applicable laws and regulations.")
-        print("=" * 80 + "\n")
+        sys.stdout.write("\n".join(out))
+        sys.stdout.write("\n")
 
         # Exit with error code if there are warnings
         return 1 if result.warnings else 0
 
 
+def evaluate_batch(configs) -> Dict[str, "numpy.ndarray"]:
+    """Evaluate law applicability for many configs at once.
+
+    configs is an (N, len(_CONFIG_KEYS)) numpy array of 0/1 answers with
+    columns in _CONFIG_KEYS order. The applicability rules run as
+    vectorized boolean algebra over whole columns instead of per-config
+    Python checks. Returns a dict mapping each Law member's name to an
+    N-length boolean array of whether that law applies.
+    """
+    cols = {k: configs[:, i].astype(bool) for i, k in enumerate(_CONFIG_KEYS)}
+
+    collects = cols["collects_health_info"]
+    is_covered_entity = cols["is_health_plan"] | cols["is_healthcare_provider"]
+    hipaa_applies = is_covered_entity | cols["works_for_covered_entity"]
+
+    # FDA regulation: medical use, no administrative/lifestyle exemption,
+    # and either an FDA-regulated function or a non-low-risk prescription app.
+    fdca = (
+        cols["intended_for_medical_use"]
+        & ~cols["is_administrative_or_lifestyle_only"]
+        & (
+            cols["has_fda_regulated_function"]
+            | (~cols["is_low_risk"] & cols["requires_prescription"])
+        )
+    )
+
+    return {
+        Law.HIPAA.name: collects & hipaa_applies,
+        Law.FDCA.name: collects & fdca,
+        Law.INFO_BLOCKING.name: collects
+        & (
+            cols["is_healthcare_provider"]
+            | cols["offers_certified_hit"]
+            | cols["enables_ehi_exchange"]
+        ),
+        Law.FTC_ACT.name: collects,
+        Law.HBNR.name: collects
+        & cols["is_consumer_facing"]
+        & cols["interacts_with_phr"]
+        & ~hipaa_applies,
+        Law.COPPA.name: collects
+        & (
+            cols["intended_for_children"]
+            | cols["has_child_oriented_features"]
+            | cols["children_using_app"]
+        ),
+        Law.OARFPA.name: collects & cols["offers_substance_use_treatment"],
+    }
+
+
+def run_batch(directory):
+    """Evaluate every *.json config in a directory and print a summary"""
+    try:
+        # numpy is an optional dependency (the "batch" extra), so it is
+        # only imported when batch mode actually runs.
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        print(
+            "Batch mode requires numpy. Install it with: pip install numpy",
+            file=sys.stderr,
+        )
+        return 2
+
+    paths = sorted(Path(directory).glob("*.json"))
+    if not paths:
+        print(f"No .json config files found in {directory}", file=sys.stderr)
+        return 2
+
+    configs = np.zeros((len(paths), len(_CONFIG_KEYS)), dtype=np.uint8)
+    for row, path in enumerate(paths):
+        with open(path, "r", encoding="utf-8") as f:
+            answers = json.load(f)
+        for col, key in enumerate(_CONFIG_KEYS):
+            configs[row, col] = bool(answers[key])
+
+    laws = evaluate_batch(configs)
+
+    for row, path in enumerate(paths):
+        names = sorted(
+            _LAW_NAMES[law] for law in Law if laws[law.name][row]
+        )
+        print(f"{path.name}: {', '.join(names) if names else 'no specific health regulations'}")
+
+    return 0
+
+
 def main():
     """Main entry point"""
     print("\n🏥 Mobile Health App Compliance Assessment Tool")
     print("Based on FTC's Mobile Health Apps Interactive Tool\n")
 
-    # Get the path to the JSON file from the first command-line argument
+    # Get the path to the JSON file (or a directory of them) from the
+    # command line
     parser = argparse.ArgumentParser()
-    parser.add_argument("json_file", help="Path to the JSON file")
+    parser.add_argument("json_file", nargs="?", help="Path to the JSON file")
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Evaluate every .json config in DIR and print a per-file summary",
+    )
     args = parser.parse_args()
 
+    if args.batch:
+        sys.exit(run_batch(args.batch))
+
+    if not args.json_file:
+        parser.error("a JSON file or --batch DIR is required")
+
     with open(args.json_file, "r", encoding="utf-8") as f:
         answer_dict = json.load(f)
 